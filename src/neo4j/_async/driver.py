@@ -21,6 +21,8 @@ from __future__ import annotations
 import asyncio
 import typing as t
 import warnings
+import weakref
+from functools import lru_cache
 
 
 if t.TYPE_CHECKING:
@@ -42,6 +44,10 @@ from .._conf import (
     TrustStore,
     WorkspaceConfig,
 )
+from .._exceptions import (
+    BoltHandshakeError,
+    BoltSecurityError,
+)
 from .._meta import (
     deprecation_warn,
     experimental_warn,
@@ -78,12 +84,20 @@ from ..auth_management import (
     AsyncAuthManager,
     AsyncAuthManagers,
 )
-from ..exceptions import Neo4jError
+from ..exceptions import (
+    ConfigurationError,
+    Neo4jError,
+    ServiceUnavailable,
+)
 from .bookmark_manager import (
     AsyncNeo4jBookmarkManager,
     TBmConsumer as _TBmConsumer,
     TBmSupplier as _TBmSupplier,
 )
+from .io import (
+    AsyncBoltPool,
+    AsyncNeo4jPool,
+)
 from .work import (
     AsyncManagedTransaction,
     AsyncResult,
@@ -111,6 +125,41 @@ else:
 
 _T = t.TypeVar("_T")
 
+_TRUST_VALUES = (
+    TRUST_ALL_CERTIFICATES,
+    TRUST_SYSTEM_CA_SIGNED_CERTIFICATES,
+)
+_UNSECURED_URI_SCHEMES = (
+    URI_SCHEME_BOLT,
+    URI_SCHEME_NEO4J,
+)
+_SECURED_URI_SCHEMES = (
+    URI_SCHEME_BOLT_SELF_SIGNED_CERTIFICATE,
+    URI_SCHEME_BOLT_SECURE,
+    URI_SCHEME_NEO4J_SELF_SIGNED_CERTIFICATE,
+    URI_SCHEME_NEO4J_SECURE,
+)
+_SECURED_SECURITY_TYPES = (
+    SECURITY_TYPE_SELF_SIGNED_CERTIFICATE,
+    SECURITY_TYPE_SECURE,
+)
+
+#: Config implied by the URI scheme's security type
+_SECURITY_TYPE_CONFIG: t.Dict[str, t.Tuple[t.Tuple[str, t.Any], ...]] = {
+    SECURITY_TYPE_SECURE: (
+        ("encrypted", True),
+    ),
+    SECURITY_TYPE_SELF_SIGNED_CERTIFICATE: (
+        ("encrypted", True),
+        ("trusted_certificates", TrustAll()),
+    ),
+}
+
+#: Drivers created with ``reuse=True``, keyed by their construction arguments
+#: (and for async drivers by the event loop they were created in)
+_SHARED_DRIVERS: weakref.WeakValueDictionary[t.Any, AsyncDriver] = \
+    weakref.WeakValueDictionary()
+
 
 class AsyncGraphDatabase:
     """Accessor for :class:`neo4j.AsyncDriver` construction.
@@ -164,7 +213,8 @@ class AsyncGraphDatabase:
             fetch_size: int = ...,
             impersonated_user: t.Optional[str] = ...,
             bookmark_manager: t.Union[AsyncBookmarkManager,
-                                      BookmarkManager, None] = ...
+                                      BookmarkManager, None] = ...,
+            reuse: bool = ...
         ) -> AsyncDriver:
             ...
 
@@ -193,6 +243,15 @@ class AsyncGraphDatabase:
                 key-word arguments.
             """
 
+            shared_key = None
+            if config.pop("reuse", False):
+                shared_key = _shared_driver_key(uri, auth, config)
+                if shared_key is not None:
+                    shared_driver = _SHARED_DRIVERS.get(shared_key)
+                    if (shared_driver is not None
+                            and not shared_driver._closed):
+                        return shared_driver
+
             driver_type, security_type, parsed = parse_neo4j_uri(uri)
 
             if not isinstance(auth, AsyncAuthManager):
@@ -208,23 +267,14 @@ class AsyncGraphDatabase:
             config["auth"] = auth
 
             # TODO: 6.0 - remove "trust" config option
-            if "trust" in config.keys():
-                if config["trust"] not in (
-                    TRUST_ALL_CERTIFICATES,
-                    TRUST_SYSTEM_CA_SIGNED_CERTIFICATES
-                ):
-                    from ..exceptions import ConfigurationError
+            if "trust" in config:
+                if config["trust"] not in _TRUST_VALUES:
                     raise ConfigurationError(
-                        "The config setting `trust` values are {!r}"
-                        .format(
-                            [
-                                TRUST_ALL_CERTIFICATES,
-                                TRUST_SYSTEM_CA_SIGNED_CERTIFICATES,
-                            ]
-                        )
+                        "The config setting `trust` values are "
+                        f"{list(_TRUST_VALUES)!r}"
                     )
 
-            if ("trusted_certificates" in config.keys()
+            if ("trusted_certificates" in config
                 and not isinstance(config["trusted_certificates"],
                                    TrustStore)):
                 raise ConnectionError(
@@ -235,38 +285,22 @@ class AsyncGraphDatabase:
                     )
                 )
 
-            if (security_type in [SECURITY_TYPE_SELF_SIGNED_CERTIFICATE, SECURITY_TYPE_SECURE]
-                and ("encrypted" in config.keys()
-                     or "trust" in config.keys()
-                     or "trusted_certificates" in config.keys()
-                     or "ssl_context" in config.keys())):
-                from ..exceptions import ConfigurationError
-
+            if (security_type in _SECURED_SECURITY_TYPES
+                and ("encrypted" in config
+                     or "trust" in config
+                     or "trusted_certificates" in config
+                     or "ssl_context" in config)):
                 # TODO: 6.0 - remove "trust" from error message
                 raise ConfigurationError(
                     'The config settings "encrypted", "trust", '
                     '"trusted_certificates", and "ssl_context" can only be '
-                    "used with the URI schemes {!r}. Use the other URI "
-                    "schemes {!r} for setting encryption settings."
-                    .format(
-                        [
-                            URI_SCHEME_BOLT,
-                            URI_SCHEME_NEO4J,
-                        ],
-                        [
-                            URI_SCHEME_BOLT_SELF_SIGNED_CERTIFICATE,
-                            URI_SCHEME_BOLT_SECURE,
-                            URI_SCHEME_NEO4J_SELF_SIGNED_CERTIFICATE,
-                            URI_SCHEME_NEO4J_SECURE,
-                        ]
-                    )
+                    "used with the URI schemes "
+                    f"{list(_UNSECURED_URI_SCHEMES)!r}. Use the other URI "
+                    f"schemes {list(_SECURED_URI_SCHEMES)!r} for setting "
+                    "encryption settings."
                 )
 
-            if security_type == SECURITY_TYPE_SECURE:
-                config["encrypted"] = True
-            elif security_type == SECURITY_TYPE_SELF_SIGNED_CERTIFICATE:
-                config["encrypted"] = True
-                config["trusted_certificates"] = TrustAll()
+            config.update(_SECURITY_TYPE_CONFIG.get(security_type, ()))
             _normalize_notifications_config(config)
 
             assert driver_type in (DRIVER_BOLT, DRIVER_NEO4J)
@@ -284,11 +318,15 @@ class AsyncGraphDatabase:
                     #     'Routing parameters are not supported with scheme '
                     #     '"bolt". Given URI "{}".'.format(uri)
                     # )
-                return cls.bolt_driver(parsed.netloc, **config)
-            # else driver_type == DRIVER_NEO4J
-            routing_context = parse_routing_context(parsed.query)
-            return cls.neo4j_driver(parsed.netloc,
-                                    routing_context=routing_context, **config)
+                driver = cls.bolt_driver(parsed.netloc, **config)
+            else:  # driver_type == DRIVER_NEO4J
+                routing_context = parse_routing_context(parsed.query)
+                driver = cls.neo4j_driver(parsed.netloc,
+                                          routing_context=routing_context,
+                                          **config)
+            if shared_key is not None:
+                _SHARED_DRIVERS[shared_key] = driver
+            return driver
 
     @classmethod
     def bookmark_manager(
@@ -378,15 +416,9 @@ class AsyncGraphDatabase:
         """ Create a driver for direct Bolt server access that uses
         socket I/O and thread-based concurrency.
         """
-        from .._exceptions import (
-            BoltHandshakeError,
-            BoltSecurityError,
-        )
-
         try:
             return AsyncBoltDriver.open(target, **config)
         except (BoltHandshakeError, BoltSecurityError) as error:
-            from ..exceptions import ServiceUnavailable
             raise ServiceUnavailable(str(error)) from error
 
     @classmethod
@@ -394,15 +426,9 @@ class AsyncGraphDatabase:
         """ Create a driver for routing-capable Neo4j service access
         that uses socket I/O and thread-based concurrency.
         """
-        from .._exceptions import (
-            BoltHandshakeError,
-            BoltSecurityError,
-        )
-
         try:
             return AsyncNeo4jDriver.open(*targets, routing_context=routing_context, **config)
         except (BoltHandshakeError, BoltSecurityError) as error:
-            from ..exceptions import ServiceUnavailable
             raise ServiceUnavailable(str(error)) from error
 
 
@@ -426,9 +452,7 @@ class _Direct:
         """
         if not target:
             target = cls.default_target
-        address = Address.parse(target, default_host=cls.default_host,
-                                default_port=cls.default_port)
-        return address
+        return _parse_address(target, cls.default_host, cls.default_port)
 
 
 class _Routing:
@@ -453,8 +477,8 @@ class _Routing:
         targets = " ".join(targets)
         if not targets:
             targets = cls.default_targets
-        addresses = Address.parse_list(targets, default_host=cls.default_host, default_port=cls.default_port)
-        return addresses
+        return list(_parse_address_list(targets, cls.default_host,
+                                        cls.default_port))
 
 
 class AsyncDriver:
@@ -472,6 +496,7 @@ class AsyncDriver:
         assert pool is not None
         assert default_workspace_config is not None
         self._pool = pool
+        self._encrypted = bool(pool.pool_config.encrypted)
         self._default_workspace_config = default_workspace_config
         self._query_bookmark_manager = AsyncGraphDatabase.bookmark_manager()
 
@@ -494,12 +519,15 @@ class AsyncDriver:
                     "call `.close()` explicitly. Future versions of the "
                     "driver will not close drivers automatically."
                 )
-                self.close()
+                # Don't block the garbage collector on the pool's lock or on
+                # network I/O.
+                self._pool.kill()
+                self._closed = True
 
     @property
     def encrypted(self) -> bool:
         """Indicate whether the driver was configured to use encryption."""
-        return bool(self._pool.pool_config.encrypted)
+        return self._encrypted
 
     def _prepare_session_config(self, **config):
         if "auth" in config:
@@ -1048,10 +1076,7 @@ class AsyncDriver:
             won't throw a :exc:`ConfigurationError` when trying to use this
             driver feature.
         """
-        async with self.session() as session:
-            await session._connect(READ_ACCESS)
-            assert session._connection
-            return session._connection.supports_multiple_databases
+        return await self._pool.supports_multiple_databases(READ_ACCESS)
 
     if t.TYPE_CHECKING:
 
@@ -1213,7 +1238,6 @@ class AsyncBoltDriver(_Direct, AsyncDriver):
         :returns:
         :rtype: :class: `neo4j.BoltDriver`
         """
-        from .io import AsyncBoltPool
         address = cls.parse_target(target)
         pool_config, default_workspace_config = Config.consume_chain(config, PoolConfig, WorkspaceConfig)
         pool = AsyncBoltPool.open(address, pool_config=pool_config, workspace_config=default_workspace_config)
@@ -1253,7 +1277,6 @@ class AsyncNeo4jDriver(_Routing, AsyncDriver):
 
     @classmethod
     def open(cls, *targets, routing_context=None, **config):
-        from .io import AsyncNeo4jPool
         addresses = cls.parse_targets(*targets)
         pool_config, default_workspace_config = Config.consume_chain(config, PoolConfig, WorkspaceConfig)
         pool = AsyncNeo4jPool.open(*addresses, routing_context=routing_context, pool_config=pool_config, workspace_config=default_workspace_config)
@@ -1272,6 +1295,48 @@ class AsyncNeo4jDriver(_Routing, AsyncDriver):
             return AsyncSession(self._pool, session_config)
 
 
+@lru_cache(maxsize=256)
+def _parse_address(target, default_host, default_port):
+    return Address.parse(target, default_host=default_host,
+                         default_port=default_port)
+
+
+@lru_cache(maxsize=256)
+def _parse_address_list(targets, default_host, default_port):
+    return tuple(Address.parse_list(targets, default_host=default_host,
+                                    default_port=default_port))
+
+
+def _shared_driver_key(uri, auth, config):
+    loop = None
+    if AsyncUtil.is_async_code:
+        # The pool's locks and sockets are bound to the loop the driver is
+        # used in. Sharing a driver across loops would break it.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no loop to bind the shared driver to => don't share it
+            return None
+
+    def freeze(value):
+        if isinstance(value, Auth):
+            return Auth, freeze(vars(value))
+        if isinstance(value, dict):
+            return frozenset((k, freeze(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(map(freeze, value))
+        return value
+
+    try:
+        key = loop, uri, freeze(auth), freeze(config)
+        hash(key)
+    except TypeError:
+        # unhashable config values (e.g., custom objects with __eq__ but
+        # without __hash__) => don't share the driver
+        return None
+    return key
+
+
 def _normalize_notifications_config(config):
     if config.get("notifications_disabled_categories") is not None:
         config["notifications_disabled_categories"] = [
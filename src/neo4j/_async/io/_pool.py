@@ -338,6 +338,30 @@ class AsyncIOPool(abc.ABC):
         """
         ...
 
+    async def _acquire_default(self, access_mode):
+        """ Acquire a connection as a session with default config would.
+        """
+        return await self.acquire(
+            access_mode=access_mode,
+            timeout=self.workspace_config.connection_acquisition_timeout,
+            database=self.workspace_config.database,
+            bookmarks=None,
+            auth=None,
+            liveness_check_timeout=None,
+        )
+
+    async def supports_multiple_databases(self, access_mode):
+        """ Check if the remote supports multiple databases.
+
+        The capability is taken from the handshake of a connection acquired
+        straight from the pool. No session is involved.
+        """
+        connection = await self._acquire_default(access_mode)
+        try:
+            return connection.supports_multiple_databases
+        finally:
+            await self.release(connection)
+
     def kill_and_release(self, *connections):
         """ Release connections back into the pool after closing them.
 
@@ -492,6 +516,23 @@ class AsyncIOPool(abc.ABC):
         except TypeError:
             pass
 
+    def kill(self):
+        """ Kill all connections and empty the pool.
+
+        Unlike :meth:`close`, this neither waits for the pool's lock nor
+        sends GOODBYE to the server. It is meant to be used from destructors
+        where blocking is not an option.
+        """
+        log.debug("[#0000]  _: <POOL> kill")
+        # Swap in a new dict instead of emptying the old one. Rebinding the
+        # attribute is atomic, and code iterating or mutating the old dict
+        # while holding the lock is not disturbed. The copies guard against
+        # such code mutating the old dict while we iterate it.
+        connections, self.connections = self.connections, defaultdict(deque)
+        for address_connections in list(connections.values()):
+            for connection in list(address_connections):
+                connection.kill()
+
 
 class AsyncBoltPool(AsyncIOPool):
 
@@ -941,6 +982,33 @@ class AsyncNeo4jPool(AsyncIOPool):
             else:
                 return connection
 
+    async def _acquire_default(self, access_mode):
+        database = self.workspace_config.database
+        if database is None:
+            # Resolve the home database first, like a session does. Else, the
+            # routing table for database `None` would never get populated.
+            log.debug("[#0000]  _: <POOL> resolve home database")
+            resolved_databases = []
+            await self.update_routing_table(
+                database=database,
+                imp_user=self.workspace_config.impersonated_user,
+                bookmarks=None,
+                acquisition_timeout=(
+                    self.workspace_config.connection_acquisition_timeout
+                ),
+                database_callback=resolved_databases.append
+            )
+            if resolved_databases:
+                database = resolved_databases[-1]
+        return await self.acquire(
+            access_mode=access_mode,
+            timeout=self.workspace_config.connection_acquisition_timeout,
+            database=database,
+            bookmarks=None,
+            auth=None,
+            liveness_check_timeout=None,
+        )
+
     async def deactivate(self, address):
         """ Deactivate an address from the connection pool,
         if present, remove from the routing table and also closing
@@ -18,14 +18,12 @@
 
 from __future__ import annotations
 
-import warnings
 from abc import ABCMeta
 from collections.abc import Mapping
 
 from ._meta import (
     deprecation_warn,
     experimental_warn,
-    ExperimentalWarning,
 )
 from .api import (
     DEFAULT_DATABASE,
@@ -194,12 +192,17 @@ class ConfigType(ABCMeta):
                 attributes[k] = v.value
                 continue
 
+        # computed once per class as they are looked up for every config key
+        # that gets consumed or set
+        field_keys = frozenset(fields)
+        deprecated_keys = (frozenset(deprecated_aliases.keys())
+                           | frozenset(deprecated_alternatives.keys()))
+
         def keys(_):
-            return set(fields)
+            return field_keys
 
         def _deprecated_keys(_):
-            return (set(deprecated_aliases.keys())
-                    | set(deprecated_alternatives.keys()))
+            return deprecated_keys
 
         def _get_new(_, key):
             return deprecated_aliases.get(
@@ -319,13 +322,30 @@ class Config(Mapping, metaclass=ConfigType):
             raise ConfigurationError("Unexpected config keys: "
                                      + ", ".join(rejected_keys))
 
+    def __copy(self, config):
+        # The values of another config have already been validated (and
+        # warned about) when it was created. So there is no need to go
+        # through __update and its warning machinery again. This matters as
+        # every session is created on top of the driver's workspace config.
+        keys = self.keys()
+        rejected_keys = []
+        for key in config.keys():
+            value = getattr(config, key)
+            if value is None:
+                continue
+            if key in keys:
+                setattr(self, key, value)
+            else:
+                rejected_keys.append(key)
+
+        if rejected_keys:
+            raise ConfigurationError("Unexpected config keys: "
+                                     + ", ".join(rejected_keys))
+
     def __init__(self, *args, **kwargs):
         for arg in args:
             if isinstance(arg, Config):
-                with warnings.catch_warnings():
-                    for cat in (DeprecationWarning, ExperimentalWarning):
-                        warnings.filterwarnings("ignore", category=cat)
-                    self.__update(arg)
+                self.__copy(arg)
             else:
                 self.__update(arg)
         self.__update(kwargs)
@@ -168,4 +168,4 @@ class RoutingTable:
         log.debug("[#0000]  _: <ROUTING> updated table=%r", self)
 
     def servers(self):
-        return set(self.routers) | set(self.writers) | set(self.readers)
+        return set(self.routers).union(self.writers, self.readers)
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import abc
 import typing as t
+from functools import lru_cache
 from urllib.parse import (
     parse_qs,
     urlparse,
@@ -478,6 +479,7 @@ class AsyncBookmarkManager(_Protocol, metaclass=abc.ABCMeta):
     get_bookmarks.__doc__ = BookmarkManager.get_bookmarks.__doc__
 
 
+@lru_cache(maxsize=128)
 def parse_neo4j_uri(uri):
     parsed = urlparse(uri)
 
@@ -536,8 +538,14 @@ def check_access_mode(access_mode):
 def parse_routing_context(query):
     """ Parse the query portion of a URI to generate a routing context dictionary.
     """
+    # the routing context gets amended by the pool, so hand out a fresh dict
+    return dict(_parse_routing_context(query))
+
+
+@lru_cache(maxsize=128)
+def _parse_routing_context(query):
     if not query:
-        return {}
+        return ()
 
     context = {}
     parameters = parse_qs(query, True)
@@ -550,4 +558,4 @@ def parse_routing_context(query):
             raise ConfigurationError("Invalid parameters:'%s=%s' in query string '%s'." % (key, value, query))
         context[key] = value
 
-    return context
+    return tuple(context.items())
@@ -44,6 +44,7 @@ from neo4j._async.io import (
     AsyncBoltPool,
     AsyncNeo4jPool,
 )
+from neo4j._async_compat.util import AsyncUtil
 from neo4j._conf import (
     PoolConfig,
     SessionConfig,
@@ -167,6 +168,15 @@ async def test_driver_config_error(
         await driver.close()
 
 
+def test_parse_targets_returns_new_list() -> None:
+    addresses1 = AsyncNeo4jDriver.parse_targets("localhost:1234", ":4321")
+    addresses1.append(neo4j.Address(("example.com", 7687)))
+    addresses2 = AsyncNeo4jDriver.parse_targets("localhost:1234", ":4321")
+
+    assert addresses2 == [neo4j.Address(("localhost", 1234)),
+                          neo4j.Address(("localhost", 4321))]
+
+
 @pytest.mark.parametrize("test_uri", (
     "http://localhost:9001",
     "ftp://localhost:9001",
@@ -192,6 +202,90 @@ def test_driver_trust_config_error(
         AsyncGraphDatabase.driver("bolt://127.0.0.1:9001", **test_config)
 
 
+@pytest.mark.parametrize("uri", (
+    "bolt://127.0.0.1:9000",
+    "neo4j://127.0.0.1:9000",
+))
+@pytest.mark.parametrize("auth", (
+    None, ("user", "pass"), neo4j.basic_auth("user", "pass"),
+))
+@mark_async_test
+async def test_driver_reuse(uri, auth) -> None:
+    driver1 = AsyncGraphDatabase.driver(uri, auth=auth, reuse=True,
+                                        max_connection_pool_size=42)
+    driver2 = AsyncGraphDatabase.driver(uri, auth=auth, reuse=True,
+                                        max_connection_pool_size=42)
+    assert driver1 is driver2
+
+    driver3 = AsyncGraphDatabase.driver(uri, auth=auth, reuse=True,
+                                        max_connection_pool_size=43)
+    driver4 = AsyncGraphDatabase.driver(uri, auth=auth,
+                                        max_connection_pool_size=42)
+    assert driver3 is not driver1
+    assert driver4 is not driver1
+
+    await driver1.close()
+    driver5 = AsyncGraphDatabase.driver(uri, auth=auth, reuse=True,
+                                        max_connection_pool_size=42)
+    assert driver5 is not driver1
+
+    for driver in (driver3, driver4, driver5):
+        await driver.close()
+
+
+@AsyncTestDecorators.mark_async_only_test
+async def test_driver_reuse_is_bound_to_event_loop(mocker) -> None:
+    uri = "neo4j://127.0.0.1:9000"
+    driver1 = AsyncGraphDatabase.driver(uri, reuse=True)
+
+    mocker.patch("asyncio.get_running_loop", return_value=mocker.Mock())
+    driver2 = AsyncGraphDatabase.driver(uri, reuse=True)
+    mocker.stopall()
+    mocker.patch("asyncio.get_running_loop", side_effect=RuntimeError)
+    driver3 = AsyncGraphDatabase.driver(uri, reuse=True)
+    driver4 = AsyncGraphDatabase.driver(uri, reuse=True)
+    mocker.stopall()
+
+    assert driver2 is not driver1
+    assert driver3 is not driver1
+    assert driver3 is not driver4
+    assert AsyncGraphDatabase.driver(uri, reuse=True) is driver1
+    for driver in (driver1, driver2, driver3, driver4):
+        await driver.close()
+
+
+@mark_async_test
+async def test_driver_reuse_with_unhashable_config() -> None:
+    resolver = SomeUnhashableClass()
+    driver1 = AsyncGraphDatabase.driver("neo4j://127.0.0.1:9000",
+                                        reuse=True, resolver=resolver)
+    driver2 = AsyncGraphDatabase.driver("neo4j://127.0.0.1:9000",
+                                        reuse=True, resolver=resolver)
+    assert driver1 is not driver2
+    await driver1.close()
+    await driver2.close()
+
+
+@mark_async_test
+async def test_driver_destructor_does_not_block(mocker) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://127.0.0.1:9000")
+    pool_mock = mocker.patch.object(driver, "_pool", autospec=True)
+
+    with pytest.warns(ResourceWarning):
+        if AsyncUtil.is_async_code:
+            driver.__del__()
+        else:
+            with pytest.warns(DeprecationWarning):
+                driver.__del__()
+
+    if AsyncUtil.is_async_code:
+        pool_mock.kill.assert_not_called()
+    else:
+        pool_mock.kill.assert_called_once_with()
+    pool_mock.close.assert_not_called()
+    await driver.close()
+
+
 @pytest.mark.parametrize("uri", (
     "bolt://127.0.0.1:9000",
     "neo4j://127.0.0.1:9000",
@@ -478,6 +572,7 @@ async def test_driver_factory_with_notification_filters(
         return_value=mocker.AsyncMock(spec=pool_cls)
     )
     open_mock.return_value.address = mocker.Mock()
+    open_mock.return_value.pool_config = PoolConfig()
     mocker.patch.object(AsyncBoltPool, "open", new=open_mock)
 
     if min_sev is ...:
@@ -559,6 +654,7 @@ async def test_session_factory_with_notification_filter(
     pool_mock: t.Any = mocker.AsyncMock(spec=pool_cls)
     mocker.patch.object(pool_cls, "open", return_value=pool_mock)
     pool_mock.address = mocker.Mock()
+    pool_mock.pool_config = PoolConfig()
     session_cls_mock = mocker.patch("neo4j._async.driver.AsyncSession",
                                     autospec=True)
 
@@ -610,6 +706,14 @@ class SomeClass:
     pass
 
 
+class SomeUnhashableClass:
+    def __eq__(self, other):
+        return self is other
+
+    def __call__(self, address):
+        return [address]
+
+
 @mark_async_test
 async def test_execute_query_work(mocker) -> None:
     tx_mock = mocker.AsyncMock(spec=neo4j.AsyncManagedTransaction)
@@ -951,6 +1055,33 @@ async def test_execute_query_result_transformer(
     assert res is session_executor_mock.return_value
 
 
+@mark_async_test
+async def test_driver_instance_attributes_can_be_patched(mocker) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://127.0.0.1:9000")
+    verify_mock = mocker.patch.object(driver, "verify_connectivity",
+                                      autospec=True)
+    async with driver as driver:
+        await driver.verify_connectivity()
+
+    verify_mock.assert_awaited_once_with()
+
+
+@mark_async_test
+async def test_supports_multi_db(mocker) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+    session_cls_mock = mocker.patch("neo4j._async.driver.AsyncSession",
+                                    autospec=True)
+    pool_mock = mocker.patch.object(driver, "_pool", autospec=True)
+    async with driver as driver:
+        res = await driver.supports_multi_db()
+
+    session_cls_mock.assert_not_called()
+    pool_mock.supports_multiple_databases.assert_awaited_once_with(
+        READ_ACCESS
+    )
+    assert res is pool_mock.supports_multiple_databases.return_value
+
+
 @mark_async_test
 async def test_supports_session_auth(mocker) -> None:
     driver = AsyncGraphDatabase.driver("bolt://localhost")
@@ -352,3 +352,11 @@ def test_parse_routing_context_should_error_when_value_missing() -> None:
 def test_parse_routing_context_should_error_when_key_duplicate() -> None:
     with pytest.raises(ConfigurationError):
         neo4j.api.parse_routing_context("name=molly&name=white")
+
+
+def test_parse_routing_context_returns_fresh_dict() -> None:
+    context1 = neo4j.api.parse_routing_context("name=molly&color=white")
+    context1["address"] = "localhost:7687"
+    context2 = neo4j.api.parse_routing_context("name=molly&color=white")
+    assert context2 == {"name": "molly", "color": "white"}
+    assert context1 is not context2
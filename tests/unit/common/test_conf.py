@@ -410,3 +410,23 @@ def test_custom_ssl_context(encrypted, trusted_certificates):
     })
     assert pool_config.encrypted is encrypted
     assert pool_config.get_ssl_context() is custom_ssl_context
+
+
+def test_init_session_config_from_workspace_config():
+    workspace_config = WorkspaceConfig.consume({"fetch_size": 42,
+                                                "database": "foo"})
+    session_config = SessionConfig(workspace_config,
+                                   {"default_access_mode": READ_ACCESS})
+
+    assert session_config.fetch_size == 42
+    assert session_config.database == "foo"
+    assert session_config.default_access_mode == READ_ACCESS
+    assert (session_config.max_transaction_retry_time
+            == WorkspaceConfig.max_transaction_retry_time)
+
+
+def test_init_workspace_config_from_session_config_rejects_keys():
+    session_config = SessionConfig(default_access_mode=READ_ACCESS)
+
+    with pytest.raises(ConfigurationError):
+        WorkspaceConfig(session_config)
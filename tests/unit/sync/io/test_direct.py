@@ -19,7 +19,10 @@
 import pytest
 
 import neo4j
-from neo4j import PreviewWarning
+from neo4j import (
+    PreviewWarning,
+    READ_ACCESS,
+)
 from neo4j._conf import (
     Config,
     PoolConfig,
@@ -57,6 +60,7 @@ class QuickConnection:
         self.address = socket.getpeername()
         self.local_port = self.address[1]
         self.connection_id = "bolt-1234"
+        self.supports_multiple_databases = True
 
     @property
     def is_reset(self):
@@ -74,6 +78,9 @@ class QuickConnection:
     def close(self):
         self.socket.close()
 
+    def kill(self):
+        self.socket.close()
+
     def closed(self):
         return False
 
@@ -104,7 +111,8 @@ class FakeBoltPool(IOPool):
         liveness_check_timeout
     ):
         return self._acquire(
-            self.address, auth, timeout, liveness_check_timeout
+            self.address, auth, Deadline.from_timeout_or_deadline(timeout),
+            liveness_check_timeout
         )
 
 def static_auth(auth):
@@ -222,6 +230,38 @@ def test_pool_in_use_count(pool):
     assert pool.in_use_connection_count(address) == 0
 
 
+@mark_sync_test
+def test_pool_kill(pool, mocker):
+    address_1 = neo4j.Address(("127.0.0.1", 7687))
+    address_2 = neo4j.Address(("127.0.0.1", 7474))
+    connection_1 = pool._acquire(address_1, None, Deadline(3), None)
+    connection_2 = pool._acquire(address_2, None, Deadline(3), None)
+    pool.release(connection_2)
+    for connection in (connection_1, connection_2):
+        mocker.patch.object(connection, "kill", autospec=True)
+        mocker.patch.object(connection, "close", autospec=True)
+
+    connections = pool.connections
+
+    pool.kill()
+
+    # the old dict is swapped out, not mutated, so concurrent users holding
+    # the lock while iterating it are not affected
+    assert pool.connections is not connections
+    assert set(connections) == {address_1, address_2}
+    assert_pool_size(address_1, 0, 0, pool)
+    assert_pool_size(address_2, 0, 0, pool)
+    for connection in (connection_1, connection_2):
+        connection.kill.assert_called_once_with()
+        connection.close.assert_not_called()
+
+
+@mark_sync_test
+def test_pool_supports_multiple_databases(pool):
+    assert pool.supports_multiple_databases(READ_ACCESS) is True
+    assert_pool_size(pool.address, 0, 1, pool)
+
+
 @mark_sync_test
 def test_pool_max_conn_pool_size(pool):
     with FakeBoltPool((), max_connection_pool_size=1) as pool:
@@ -191,6 +191,29 @@ def test_reuses_connection(opener):
     assert cx1 is cx2
 
 
+@pytest.mark.parametrize("supports_multi_db", (True, False))
+@mark_sync_test
+def test_supports_multiple_databases(opener, supports_multi_db):
+    open_ = opener.side_effect
+
+    def open_with_capability(*args, **kwargs):
+        connection = open_(*args, **kwargs)
+        connection.supports_multiple_databases = supports_multi_db
+        return connection
+
+    opener.side_effect = open_with_capability
+    pool = _simple_pool(opener)
+
+    res = pool.supports_multiple_databases(READ_ACCESS)
+
+    assert res is supports_multi_db
+    assert pool.routing_tables.get(None)
+    readers = [cx for cx in opener.connections
+               if cx.unresolved_address == READER_ADDRESS]
+    assert len(readers) == 1
+    assert not readers[0].in_use
+
+
 @pytest.mark.parametrize("break_on_close", (True, False))
 @mark_sync_test
 def test_closes_stale_connections(opener, break_on_close):